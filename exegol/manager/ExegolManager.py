@@ -104,8 +104,7 @@ class ExegolManager:
         ExegolManager.print_version()
         logger.info("Stopping exegol")
         container = cls.__loadOrCreateContainer(multiple=True, must_exist=True)
-        for c in container:
-            c.stop(timeout=2)
+        ExegolContainer.bulkStop(cast(List[ExegolContainer], container), timeout=2)
 
     @classmethod
     def install(cls):
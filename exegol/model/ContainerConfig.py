@@ -49,6 +49,8 @@ class ContainerConfig:
         self.__privileged: bool = False
         self.__mounts: List[Mount] = []
         self.__devices: List[str] = []
+        # Cache of the host path of every device (built on demand)
+        self.__devices_host: Optional[List[str]] = None
         self.__capabilities: List[str] = []
         self.__sysctls: Dict[str, str] = {}
         self.__envs: Dict[str, str] = {}
@@ -861,6 +863,7 @@ class ContainerConfig:
         if mknod:
             perm += 'm'
         self.__devices.append(f"{device_source}:{device_dest}:{perm}")
+        self.__devices_host = None
 
     def addUserDevice(self, user_device_config: str):
         """Add a device from a user parameters"""
@@ -874,9 +877,10 @@ class ContainerConfig:
         """Remove a device from the container configuration (Only before container creation)"""
         for i in range(len(self.__devices)):
             # For each device, compare source device
-            if self.__devices[i].split(':')[0] == device_source:
+            if self.__devices[i].partition(':')[0] == device_source:
                 # When found, remove it from the config list
                 self.__devices.pop(i)
+                self.__devices_host = None
                 return True
         return False
 
@@ -884,6 +888,12 @@ class ContainerConfig:
         """Devices config getter"""
         return self.__devices
 
+    def getDevicesHostPath(self) -> List[str]:
+        """Getter of the host path of each device"""
+        if self.__devices_host is None:
+            self.__devices_host = [device.partition(':')[0] for device in self.__devices]
+        return self.__devices_host
+
     def addEnv(self, key: str, value: str):
         """Add an environment variable to the container configuration"""
         self.__envs[key] = value
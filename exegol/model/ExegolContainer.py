@@ -1,9 +1,13 @@
-import base64
+import contextlib
 import os
-import shutil
-from typing import Optional, Dict, Sequence, Tuple
+import shlex
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Sequence, Tuple, ContextManager
 
-from docker.errors import NotFound, ImageNotFound
+from docker.errors import APIError, NotFound, ImageNotFound
 from docker.models.containers import Container
 
 from exegol.console.ExegolPrompt import Confirm
@@ -12,6 +16,8 @@ from exegol.model.ContainerConfig import ContainerConfig
 from exegol.model.ExegolContainerTemplate import ExegolContainerTemplate
 from exegol.model.ExegolImage import ExegolImage
 from exegol.model.SelectableInterface import SelectableInterface
+from exegol.utils import FsUtils
+from exegol.utils.ContainerEventMonitor import ContainerEventMonitor
 from exegol.utils.EnvInfo import EnvInfo
 from exegol.utils.ExeLog import logger, console
 
@@ -19,30 +25,39 @@ from exegol.utils.ExeLog import logger, console
 class ExegolContainer(ExegolContainerTemplate, SelectableInterface):
     """Class of an exegol container already create in docker"""
 
+    # Display text of the docker container status
+    __STATUS_TEXT: Dict[str, str] = {"unknown": "Unknown",
+                                     "exited": "[red]Stopped",
+                                     "running": "[green]Running"}
+    # Time (in seconds) during which the container state fetched from docker is reused without reloading it
+    __STATE_CACHE_TTL: float = 0.5
+    # Maximum number of containers stopped in parallel
+    __BULK_STOP_WORKERS: int = 8
+
     def __init__(self, docker_container: Container, model: Optional[ExegolContainerTemplate] = None):
         logger.debug(f"== Loading container : {docker_container.name}")
         self.__container: Container = docker_container
         self.__id: str = docker_container.id
+        self.__short_id: str = docker_container.short_id
         self.__xhost_applied = False
+        self.__state_cache: Optional[Dict] = None
+        self.__state_ts: float = 0.0
+        self.__state_fresh: bool = False
+        # Container status updates are received from the docker event stream
+        ContainerEventMonitor().subscribe(docker_container.client, self.__id)
+        # The image of an existing container is only loaded from docker on first access (see loadImage)
+        self.__image: Optional[ExegolImage] = None
         if model is None:
-            image_name = ""
-            try:
-                # Try to find the attached docker image
-                docker_image = docker_container.image
-            except ImageNotFound:
-                # If it is not found, the user has probably forcibly deleted it manually
-                logger.warning(f"Some images were forcibly removed by docker when they were used by existing containers!")
-                logger.error(f"The '{docker_container.name}' containers might not work properly anymore and should also be deleted and recreated with a new image.")
-                docker_image = None
-                image_name = "[red bold]BROKEN[/red bold]"
             # Create Exegol container from an existing docker container
             super().__init__(docker_container.name,
-                             config=ContainerConfig(docker_container),
-                             image=ExegolImage(name=image_name, docker_image=docker_image))
-            self.image.syncContainerData(docker_container)
-            # At this stage, the container image object has an unknown status because no synchronization with a registry has been done.
-            # This could be done afterwards (with container.image.autoLoad()) if necessary because it takes time.
+                             config=ContainerConfig(docker_container))
             self.__new_container = False
+            # The docker container object has just been inspected, its state is used as a snapshot
+            # until the next start / stop operation
+            # (a newly created container is inspected by docker before its start, its state must be reloaded)
+            self.__state_cache = docker_container.attrs.get("State")
+            self.__state_ts = time.monotonic()
+            self.__state_fresh = self.__state_cache is not None
         else:
             # Create Exegol container from a newly created docker container with its object template.
             super().__init__(docker_container.name,
@@ -50,31 +65,103 @@ class ExegolContainer(ExegolContainerTemplate, SelectableInterface):
                              # Rebuild config from docker object to update workspace path
                              image=model.image)
             self.__new_container = True
-        self.image.syncStatus()
+            self.image.syncStatus()
+
+    @property
+    def image(self) -> ExegolImage:
+        """Container's image getter. The image is loaded from docker on first access."""
+        return self.loadImage()
+
+    @image.setter
+    def image(self, image: ExegolImage):
+        """Container's image setter"""
+        self.__image = image
+
+    def loadImage(self) -> ExegolImage:
+        """Load the container's image from docker (if not already done) and return it"""
+        if self.__image is None:
+            self.__image = self.__createImage()
+        return self.__image
+
+    def __createImage(self) -> ExegolImage:
+        """Create the ExegolImage object of the docker image used by the container"""
+        image_name = ""
+        try:
+            # Try to find the attached docker image
+            docker_image = self.__container.image
+        except ImageNotFound:
+            # If it is not found, the user has probably forcibly deleted it manually
+            logger.warning(f"Some images were forcibly removed by docker when they were used by existing containers!")
+            logger.error(f"The '{self.__container.name}' containers might not work properly anymore and should also be deleted and recreated with a new image.")
+            docker_image = None
+            image_name = "[red bold]BROKEN[/red bold]"
+        image = ExegolImage(name=image_name, docker_image=docker_image)
+        image.syncContainerData(self.__container)
+        # At this stage, the container image object has an unknown status because no synchronization with a registry has been done.
+        # This could be done afterwards (with container.image.autoLoad()) if necessary because it takes time.
+        image.syncStatus()
+        return image
 
     def __str__(self):
         """Default object text formatter, debug only"""
         return f"{self.getRawStatus()} - {super().__str__()}"
 
-    def __getState(self) -> Dict:
-        """Technical getter of the container status dict"""
-        self.__container.reload()
-        return self.__container.attrs.get("State", {})
+    def __getStateFresh(self) -> Dict:
+        """Technical getter of the container status dict, always reloaded from docker"""
+        try:
+            self.__container.reload()
+            self.__state_cache = self.__container.attrs.get("State", {})
+        except NotFound:
+            # The container has been removed (e.g. a temporary container with auto-remove), it can be considered as stopped
+            self.__state_cache = {"Status": "removed"}
+        self.__state_ts = time.monotonic()
+        self.__state_fresh = False
+        return self.__state_cache
+
+    def __getStateEvent(self) -> Optional[Dict]:
+        """Technical getter of the container status dict from the docker event stream.
+        Return None if no event has been received for this container."""
+        event_status = ContainerEventMonitor().getStatus(self.__id)
+        if event_status is None:
+            return None
+        state = self.__container.attrs.setdefault("State", {})
+        state["Status"] = event_status
+        return state
+
+    def __getStateLatest(self) -> Dict:
+        """Technical getter of the container status dict, from the event stream or reloaded from docker"""
+        state = self.__getStateEvent()
+        if state is None:
+            state = self.__getStateFresh()
+        return state
+
+    def __getStateCached(self) -> Dict:
+        """Technical getter of the container status dict.
+        The status is provided by the docker event stream when available,
+        otherwise the load-time snapshot or the last state fetched (if it is recent enough) is reused."""
+        state = self.__getStateEvent()
+        if state is not None:
+            return state
+        if self.__state_fresh and self.__state_cache is not None:
+            return self.__state_cache
+        if self.__state_cache is None or time.monotonic() - self.__state_ts >= self.__STATE_CACHE_TTL:
+            return self.__getStateFresh()
+        return self.__state_cache
+
+    def __invalidateState(self):
+        """Drop the cached container state, the next status request will reload it from docker"""
+        self.__state_cache = None
+        self.__state_fresh = False
+        ContainerEventMonitor().forget(self.__id)
 
     def getRawStatus(self) -> str:
         """Raw text getter of the container status"""
-        return self.__getState().get("Status", "unknown")
+        return self.__getStateCached().get("Status", "unknown")
 
     def getTextStatus(self) -> str:
         """Formatted text getter of the container status"""
         status = self.getRawStatus().lower()
-        if status == "unknown":
-            return "Unknown"
-        elif status == "exited":
-            return "[red]Stopped"
-        elif status == "running":
-            return "[green]Running"
-        return status
+        return self.__STATUS_TEXT.get(status, status)
 
     def isNew(self) -> bool:
         """Check if the container has just been created or not"""
@@ -90,7 +177,7 @@ class ExegolContainer(ExegolContainerTemplate, SelectableInterface):
 
     def getId(self) -> str:
         """Container's short id getter"""
-        return self.__container.short_id
+        return self.__short_id
 
     def getKey(self) -> str:
         """Universal unique key getter (from SelectableInterface)"""
@@ -103,30 +190,89 @@ class ExegolContainer(ExegolContainerTemplate, SelectableInterface):
             self.preStartSetup()
             with console.status(f"Waiting to start {self.name}", spinner_style="blue"):
                 self.__container.start()
+            self.__invalidateState()
 
     def stop(self, timeout: int = 10):
-        """Stop the docker container"""
-        if self.isRunning():
+        """Stop the docker container (no effect if the container is already stopped)"""
+        # Docker stop is idempotent, the current state is not reloaded beforehand
+        if self.__isLastKnownRunning():
             logger.info(f"Stopping container {self.name}")
-            with console.status(f"Waiting to stop ({timeout}s timeout)", spinner_style="blue"):
-                self.__container.stop(timeout=timeout)
+        with self.__stopStatus(f"Waiting to stop ({timeout}s timeout)"):
+            self.__stopContainer(timeout)
+
+    @classmethod
+    def bulkStop(cls, instances: Sequence["ExegolContainer"], timeout: int = 10):
+        """Stop multiple docker containers concurrently.
+        A stop is sent to every container, those already stopped are skipped by docker."""
+        if len(instances) == 0:
+            return
+        for container in instances:
+            if container.__isLastKnownRunning():
+                logger.info(f"Stopping container {container.name}")
+        with cls.__stopStatus(f"Waiting to stop {len(instances)} container(s) ({timeout}s timeout)"):
+            # Each stop blocks until its container is stopped, they are processed in parallel
+            # (limited to stay within the docker client connection pool, shared with the event stream)
+            with ThreadPoolExecutor(max_workers=min(len(instances), cls.__BULK_STOP_WORKERS)) as executor:
+                list(executor.map(lambda c: c.__stopContainer(timeout), instances))
+
+    @staticmethod
+    def __stopStatus(message: str) -> ContextManager:
+        """Spinner displayed while waiting for containers to stop.
+        Without an interactive terminal (scripts, CI), no spinner is rendered."""
+        if console.is_terminal:
+            return console.status(message, spinner_style="blue")
+        return contextlib.nullcontext()
+
+    def __isLastKnownRunning(self) -> bool:
+        """Check the last container status fetched, without any docker API call"""
+        return self.__container.attrs.get("State", {}).get("Status") == "running"
+
+    def __stopContainer(self, timeout: int):
+        """Technical stop operation of the container.
+        SIGTERM is sent first and the container status is polled until the end of the timeout before sending SIGKILL
+        (the docker stop operation locks the container in the daemon during the whole timeout)."""
+        if self.__sendSignal("SIGTERM"):
+            for _ in range(timeout * 10):
+                # Status from the event stream when available, otherwise reloaded from docker
+                if self.__getStateLatest().get("Status") != "running":
+                    break
+                time.sleep(0.1)
+            else:
+                logger.debug(f"Container {self.name} is still running after {timeout}s, sending SIGKILL")
+                self.__sendSignal("SIGKILL")
+        self.__invalidateState()
+
+    def __sendSignal(self, signal: str) -> bool:
+        """Send a signal to the container. Return False if the container is not running anymore."""
+        try:
+            self.__container.kill(signal=signal)
+        except APIError as err:
+            # 404: the container has already been removed, 409: the container is not running
+            if err.status_code not in (404, 409):
+                raise
+            return False
+        return True
 
     def spawnShell(self):
         """Spawn a shell on the docker container"""
-        logger.info(f"Location of the exegol workspace on the host : {self.config.getHostWorkspacePath()}")
-        for device in self.config.getDevices():
-            logger.info(f"Shared host device: {device.split(':')[0]}")
-        logger.success(f"Opening shell in Exegol '{self.name}'")
         # In case of multi-user environment, xhost must be set before opening each session to be sure
+        # (applied first, so it runs in the background while the shell is being opened)
         self.__applyXhostACL()
-        # Using system command to attach the shell to the user terminal (stdin / stdout / stderr)
-        envs = self.config.getShellEnvs()
-        options = ""
-        if len(envs) > 0:
-            options += f" -e {' -e '.join(envs)}"
-        cmd = f"docker exec{options} -ti {self.getFullId()} {self.config.getShellCommand()}"
-        logger.debug(f"Opening shell with: {cmd}")
-        os.system(cmd)
+        logger.info(f"Location of the exegol workspace on the host : {self.config.getHostWorkspacePath()}")
+        for device in self.config.getDevicesHostPath():
+            logger.info(f"Shared host device: {device}")
+        logger.success(f"Opening shell in Exegol '{self.name}'")
+        # Using docker CLI to attach the shell to the user terminal (stdin / stdout / stderr)
+        cmd = ["docker", "exec"]
+        for env in self.config.getShellEnvs():
+            cmd += ["-e", env]
+        cmd += ["-ti", self.getFullId()] + shlex.split(self.config.getShellCommand())
+        logger.debug(f"Opening shell with: {' '.join(cmd)}")
+        if EnvInfo.is_windows_shell:
+            subprocess.call(cmd)
+        else:
+            # Nothing left to do after the shell session, the current process is directly replaced by the docker CLI
+            os.execvp(cmd[0], cmd)
         # Docker SDK doesn't support (yet) stdin properly
         # result = self.__container.exec_run(ParametersManager().shell, stdout=True, stderr=True, stdin=True, tty=True,
         #                                    environment=self.config.getShellEnvs())
@@ -144,15 +290,27 @@ class ExegolContainer(ExegolContainerTemplate, SelectableInterface):
             if logger.getEffectiveLevel() > logger.VERBOSE and not ParametersManager().daemon:
                 logger.info("Hint: use verbose mode to see command output (-v).")
         exec_payload, str_cmd = ExegolContainer.formatShellCommand(command, quiet)
-        stream = self.__container.exec_run(exec_payload, environment={"CMD": str_cmd, "DISABLE_AUTO_UPDATE": "true"}, detach=as_daemon, stream=not as_daemon)
+        envs = {"CMD": str_cmd, "DISABLE_AUTO_UPDATE": "true"}
+        if not as_daemon and not quiet:
+            # The user command output is followed, python processes must not buffer it
+            envs["PYTHONUNBUFFERED"] = "1"
+        stream = self.__container.exec_run(exec_payload, environment=envs, detach=as_daemon, stream=not as_daemon)
         if as_daemon and not quiet:
             logger.success("Command successfully executed in background")
         else:
             try:
                 # stream[0] : exit code
                 # stream[1] : text stream
-                for log in stream[1]:
-                    logger.raw(log.decode("utf-8"))
+                if logger.isEnabledFor(logger.VERBOSE):
+                    # Raw output bytes are directly written to the terminal without decoding or formatting
+                    sys.stdout.flush()
+                    for log in stream[1]:
+                        sys.stdout.buffer.write(log)
+                        sys.stdout.buffer.flush()
+                else:
+                    # The output is not displayed, the stream is only consumed until the end of the command
+                    for _ in stream[1]:
+                        pass
                 if not quiet:
                     logger.success("End of the command")
             except KeyboardInterrupt:
@@ -167,7 +325,7 @@ class ExegolContainer(ExegolContainerTemplate, SelectableInterface):
         Set entrypoint_mode to start the command with the entrypoint.sh config loader.
         - The first return argument is the payload to execute with every pre-routine for zsh.
         - The second return argument is the command itself in str format."""
-        # Using base64 to escape special characters
+        # The command is passed to zsh through the CMD environment variable to escape special characters
         str_cmd = ' '.join(command)
         if not quiet:
             logger.success(f"Command received: {str_cmd}")
@@ -189,6 +347,8 @@ class ExegolContainer(ExegolContainerTemplate, SelectableInterface):
         except NotFound:
             logger.error(
                 f"The container {self.name} has already been removed (probably created as a temporary container).")
+        finally:
+            ContainerEventMonitor().unsubscribe(self.__id)
 
     def __removeVolume(self):
         """Remove private workspace volume directory if exist"""
@@ -203,7 +363,9 @@ class ExegolContainer(ExegolContainerTemplate, SelectableInterface):
             logger.verbose("Removing workspace volume")
             logger.debug(f"Removing volume {volume_path}")
             try:
-                is_file_present = os.listdir(volume_path)
+                # Only the first entry is needed to know if the directory is empty
+                with os.scandir(volume_path) as entries:
+                    is_file_present = next(entries, None) is not None
             except PermissionError:
                 if Confirm(f"Insufficient permission to view workspace files {volume_path}, "
                            f"do you still want to delete them?", default=False):
@@ -218,14 +380,14 @@ class ExegolContainer(ExegolContainerTemplate, SelectableInterface):
                                    default=False):
                         # User can choose not to delete the workspace on the host
                         return
-                # Try to remove files from the host with user permission (work only without sub-directory)
-                shutil.rmtree(volume_path)
+                # Try to remove files from the host with user permission
+                FsUtils.removeDirectory(volume_path)
             except PermissionError:
                 logger.info(f"Deleting the workspace files from the [green]{self.name}[/green] container as root")
                 # If the host can't remove the container's file and folders, the rm command is exec from the container itself as root
                 self.exec(["rm", "-rf", "/workspace"], as_daemon=False, quiet=True)
                 try:
-                    shutil.rmtree(volume_path)
+                    FsUtils.removeDirectory(volume_path)
                 except PermissionError:
                     logger.warning(f"I don't have the rights to remove [magenta]{volume_path}[/magenta] (do it yourself)")
                     return
@@ -260,7 +422,20 @@ class ExegolContainer(ExegolContainerTemplate, SelectableInterface):
             if EnvInfo.isMacHost():
                 # add xquartz inet ACL
                 with console.status(f"Starting XQuartz...", spinner_style="blue"):
-                    os.system(f"xhost + localhost > /dev/null")
+                    self.__runXhost("+", "localhost")
             else:
                 # add linux local ACL
-                os.system(f"xhost +local:{self.hostname} > /dev/null")
+                # No need to wait, the ACL is applied long before the first X11 connection from the container
+                self.__runXhost(f"+local:{self.hostname}", wait=False)
+
+    @staticmethod
+    def __runXhost(*args: str, wait: bool = True):
+        """Execute the host xhost command without any shell.
+        Set wait to False to run it in the background."""
+        try:
+            if wait:
+                subprocess.run(["xhost", *args], check=False, stdout=subprocess.DEVNULL)
+            else:
+                subprocess.Popen(["xhost", *args], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        except FileNotFoundError:
+            logger.warning("xhost command not found, the X11 access control of the host cannot be updated.")
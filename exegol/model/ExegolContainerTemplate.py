@@ -10,13 +10,17 @@ from exegol.model.ExegolImage import ExegolImage
 class ExegolContainerTemplate:
     """Exegol template class used to create a new container"""
 
-    def __init__(self, name: Optional[str], config: ContainerConfig, image: ExegolImage):
+    image: ExegolImage
+
+    def __init__(self, name: Optional[str], config: ContainerConfig, image: Optional[ExegolImage] = None):
+        """The image can only be omitted by a subclass providing its own image loading"""
         if name is None:
             name = Prompt.ask("[bold blue][?][/bold blue] Enter the name of your new exegol container", default="default")
         assert name is not None
         self.name: str = name.replace('exegol-', '')
         self.hostname: str = name if name.startswith("exegol-") else f'exegol-{name}'
-        self.image: ExegolImage = image
+        if image is not None:
+            self.image = image
         self.config: ContainerConfig = config
 
     def __str__(self):
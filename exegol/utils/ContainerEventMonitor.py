@@ -0,0 +1,69 @@
+import threading
+from typing import Dict, Optional, Set
+
+from docker import DockerClient
+
+from exegol.utils.ExeLog import logger
+from exegol.utils.MetaSingleton import MetaSingleton
+
+
+class ContainerEventMonitor(metaclass=MetaSingleton):
+    """Background listener of the docker container events.
+    Keep the last known status of every subscribed container without polling the docker daemon."""
+
+    # Container status resulting from each docker event action
+    __EVENT_STATUS: Dict[str, str] = {"start": "running",
+                                      "restart": "running",
+                                      "unpause": "running",
+                                      "pause": "paused",
+                                      "die": "exited",
+                                      "stop": "exited"}
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__subscribed: Set[str] = set()
+        self.__status: Dict[str, str] = {}
+        self.__thread: Optional[threading.Thread] = None
+
+    def subscribe(self, docker_client: DockerClient, container_id: str):
+        """Follow the events of a container. The listening thread is started on the first subscription."""
+        with self.__lock:
+            self.__subscribed.add(container_id)
+            if self.__thread is None:
+                self.__thread = threading.Thread(target=self.__listen, args=(docker_client,), daemon=True)
+                self.__thread.start()
+
+    def unsubscribe(self, container_id: str):
+        """Stop following the events of a container"""
+        with self.__lock:
+            self.__subscribed.discard(container_id)
+            self.__status.pop(container_id, None)
+
+    def forget(self, container_id: str):
+        """Drop the last known status of a container (until its next event)"""
+        with self.__lock:
+            self.__status.pop(container_id, None)
+
+    def getStatus(self, container_id: str) -> Optional[str]:
+        """Get the last known status of a container. Return None if no event has been received yet."""
+        with self.__lock:
+            return self.__status.get(container_id)
+
+    def __listen(self, docker_client: DockerClient):
+        """Thread routine consuming the docker event stream"""
+        try:
+            for event in docker_client.events(decode=True, filters={"type": "container"}):
+                container_id = event.get("id", "")
+                action = event.get("Action", event.get("status", ""))
+                with self.__lock:
+                    if container_id not in self.__subscribed:
+                        continue
+                    if action == "destroy":
+                        self.__status.pop(container_id, None)
+                    elif action in self.__EVENT_STATUS:
+                        self.__status[container_id] = self.__EVENT_STATUS[action]
+        except Exception as err:
+            logger.debug(f"Docker event stream closed: {err}")
+        # Without event stream, the known status cannot be trusted anymore
+        with self.__lock:
+            self.__status.clear()
@@ -81,7 +81,10 @@ class DockerUtils:
                 # Not reachable, critical logging will exit
                 return  # type: ignore
             for container in docker_containers:
-                cls.__containers.append(ExegolContainer(container))
+                exegol_container = ExegolContainer(container)
+                # Images are loaded with the listing, before any display (missing images are reported here)
+                exegol_container.loadImage()
+                cls.__containers.append(exegol_container)
         return cls.__containers
 
     @classmethod
@@ -1,5 +1,6 @@
 import logging
 import re
+import shutil
 import stat
 import subprocess
 from pathlib import Path, PurePosixPath, PurePath
@@ -53,6 +54,24 @@ def resolvStrPath(path: Optional[str]) -> str:
     return resolvPath(Path(path))
 
 
+def removeDirectory(path: str):
+    """Remove a directory and all its content.
+    On POSIX systems, the deletion is delegated to the 'rm' command instead of the python recursion of shutil.rmtree.
+    Raise PermissionError if the directory cannot be fully removed."""
+    if EnvInfo.is_windows_shell:
+        shutil.rmtree(path)
+        return
+    try:
+        result = subprocess.run(["rm", "-rf", "--", path], stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    except FileNotFoundError:
+        logger.debug("'rm' command not found, fallback to shutil")
+        shutil.rmtree(path)
+        return
+    if result.returncode != 0:
+        logger.debug(f"Error while removing {path}: {result.stderr!r}")
+        raise PermissionError(f"Unable to remove {path}")
+
+
 def setGidPermission(root_folder: Path):
     """Set the setgid permission bit to every recursive directory"""
     logger.verbose(f"Updating the permissions of {root_folder} (and sub-folders) to allow file sharing between the container and the host user")